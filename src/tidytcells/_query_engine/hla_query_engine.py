@@ -1,3 +1,4 @@
+import functools
 from typing import FrozenSet
 import warnings
 
@@ -15,6 +16,12 @@ class HlaQueryEngine(QueryEngine):
                 "protein (two allele designations)."
             )
 
+        return cls._get_query_results(precision)
+
+    # Kept separate from query so that the warning above is raised on every call
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_query_results(cls, precision: str) -> FrozenSet[str]:
         query_results = []
 
         for gene_symbol, allele_dictionary in VALID_HOMOSAPIENS_MH.items():
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+import functools
 from typing import Dict, FrozenSet
 
 from tidytcells._query_engine import QueryEngine
@@ -11,6 +12,7 @@ class TrQueryEngine(QueryEngine):
         pass
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def query(cls, precision: str, functionality: str) -> FrozenSet[str]:
         query_results = []
 
@@ -17,17 +17,32 @@ else:
 
 VALID_HOMOSAPIENS_TR = get_json_resource("valid_homosapiens_tr.json")
 HOMOSAPIENS_TR_SYNONYMS = get_json_resource("homosapiens_tr_synonyms.json")
-HOMOSAPIENS_TR_AA_SEQUENCES = get_json_resource("homosapiens_tr_aa_sequences.json")
 VALID_HOMOSAPIENS_MH = get_json_resource("valid_homosapiens_mh.json")
 HOMOSAPIENS_MH_SYNONYMS = get_json_resource("homosapiens_mh_synonyms.json")
 
 
 VALID_MUSMUSCULUS_TR = get_json_resource("valid_musmusculus_tr.json")
-MUSMUSCULUS_TR_AA_SEQUENCES = get_json_resource("musmusculus_tr_aa_sequences.json")
-VALID_MUSMUSCULUS_MH = get_json_resource("valid_musmusculus_mh.json")
+VALID_MUSMUSCULUS_MH = frozenset(get_json_resource("valid_musmusculus_mh.json"))
 MUSMUSCULUS_MH_SYNONYMS = get_json_resource("musmusculus_mh_synonyms.json")
 
 
+# The amino acid sequence tables are only needed by tr.get_aa_sequence, so they
+# are loaded on first attribute access instead of at import time.
+LAZILY_LOADED_RESOURCES = {
+    "HOMOSAPIENS_TR_AA_SEQUENCES": "homosapiens_tr_aa_sequences.json",
+    "MUSMUSCULUS_TR_AA_SEQUENCES": "musmusculus_tr_aa_sequences.json",
+}
+
+
+def __getattr__(name: str) -> dict:
+    if name in LAZILY_LOADED_RESOURCES:
+        resource = get_json_resource(LAZILY_LOADED_RESOURCES[name])
+        globals()[name] = resource
+        return resource
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 AMINO_ACIDS = frozenset(
     (
         "A",
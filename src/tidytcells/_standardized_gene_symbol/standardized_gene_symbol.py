@@ -7,6 +7,8 @@ class StandardizedGeneSymbol(ABC):
     Abstract base standardizer class.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, gene_symbol: str) -> None:
         pass
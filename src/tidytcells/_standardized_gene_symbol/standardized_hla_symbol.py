@@ -1,13 +1,49 @@
+import functools
 import itertools
 import re
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 
 from tidytcells import _utils
 from tidytcells._standardized_gene_symbol import StandardizedGeneSymbol
 from tidytcells._resources import VALID_HOMOSAPIENS_MH, HOMOSAPIENS_MH_SYNONYMS
 
 
+PERIOD_BETWEEN_DIGITS_MATCHING_REGEX = re.compile(r"(?<=\d)\.(?=\d)")
+NUMBERED_GENE_HLA_SYMBOL_MATCHING_REGEX = re.compile(
+    r"^((HLA-)?(D[PQ][AB]|DRB|TAP)\d)(\*?([\d:]+G?P?)[LSCAQN]?)?"
+)
+HLA_SYMBOL_MATCHING_REGEX = re.compile(
+    r"^([A-Z0-9\-\.\:\/]+)(\*([\d:]+G?P?)[LSCAQN]?)?"
+)
+GENE_NAME_WITH_FORGOTTEN_ASTERISK_MATCHING_REGEX = re.compile(
+    r"^(HLA-[A-Z]+)([\d:]+G?P?)$"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_valid_hla_symbols() -> FrozenSet[str]:
+    """
+    Return every gene and allele symbol spelled out by VALID_HOMOSAPIENS_MH.
+    The set is large, so it is only built the first time an HLA symbol is standardized.
+    """
+    valid_hla_symbols = []
+
+    def add_allele_symbols(prefix: str, allele_dictionary: dict) -> None:
+        for designator, further_designators in allele_dictionary.items():
+            allele_symbol = f"{prefix}{designator}"
+            valid_hla_symbols.append(allele_symbol)
+            add_allele_symbols(f"{allele_symbol}:", further_designators)
+
+    for gene, allele_dictionary in VALID_HOMOSAPIENS_MH.items():
+        valid_hla_symbols.append(gene)
+        add_allele_symbols(f"{gene}*", allele_dictionary)
+
+    return frozenset(valid_hla_symbols)
+
+
 class HlaSymbolParser:
+    __slots__ = ("gene_name", "allele_designation")
+
     gene_name: str
     allele_designation: List[str]
 
@@ -19,9 +55,7 @@ class HlaSymbolParser:
 
         hla_symbol = self._replace_periods_between_digits_with_colon(hla_symbol)
 
-        parse_attempt_1 = re.match(
-            r"^((HLA-)?(D[PQ][AB]|DRB|TAP)\d)(\*?([\d:]+G?P?)[LSCAQN]?)?", hla_symbol
-        )
+        parse_attempt_1 = NUMBERED_GENE_HLA_SYMBOL_MATCHING_REGEX.match(hla_symbol)
         if parse_attempt_1:
             self.gene_name = parse_attempt_1.group(1)
             self.allele_designation = self._listify_allele_designation(
@@ -29,9 +63,7 @@ class HlaSymbolParser:
             )
             return
 
-        parse_attempt_2 = re.match(
-            r"^([A-Z0-9\-\.\:\/]+)(\*([\d:]+G?P?)[LSCAQN]?)?", hla_symbol
-        )
+        parse_attempt_2 = HLA_SYMBOL_MATCHING_REGEX.match(hla_symbol)
         if parse_attempt_2:
             self.gene_name = parse_attempt_2.group(1)
             self.allele_designation = self._listify_allele_designation(
@@ -43,7 +75,7 @@ class HlaSymbolParser:
         self.allele_designation = []
 
     def _replace_periods_between_digits_with_colon(self, string: str) -> str:
-        return re.sub(r"(?<=\d)\.(?=\d)", ":", string)
+        return PERIOD_BETWEEN_DIGITS_MATCHING_REGEX.sub(":", string)
 
     def _listify_allele_designation(
         self, allele_designation: Optional[str]
@@ -57,11 +89,22 @@ class HlaSymbolParser:
 
 
 class StandardizedHlaSymbol(StandardizedGeneSymbol):
+    __slots__ = ("_gene_name", "_allele_designation")
+
     def __init__(self, gene_symbol: str) -> None:
         self._parse_hla_symbol(gene_symbol)
         self._resolve_errors()
 
     def _parse_hla_symbol(self, hla_symbol: str) -> None:
+        # Fully spelled-out valid symbols can be split directly, without the
+        # cleaning and regex parsing below
+        if hla_symbol in get_valid_hla_symbols():
+            self._gene_name, _, allele_designation = hla_symbol.partition("*")
+            self._allele_designation = (
+                allele_designation.split(":") if allele_designation else []
+            )
+            return
+
         cleaned_hla_symbol = _utils.clean_and_uppercase(hla_symbol)
         parsed_hla_symbol = HlaSymbolParser(cleaned_hla_symbol)
         self._gene_name = parsed_hla_symbol.gene_name
@@ -71,8 +114,9 @@ class StandardizedHlaSymbol(StandardizedGeneSymbol):
         if self.get_reason_why_invalid() is None:
             return
 
-        if self._is_synonym():
-            self._gene_name = HOMOSAPIENS_MH_SYNONYMS[self._gene_name]
+        current_gene_name = HOMOSAPIENS_MH_SYNONYMS.get(self._gene_name)
+        if current_gene_name is not None:
+            self._gene_name = current_gene_name
             if self.get_reason_why_invalid() is None:
                 return
 
@@ -90,9 +134,6 @@ class StandardizedHlaSymbol(StandardizedGeneSymbol):
 
         self._try_different_amounts_of_leading_zeros_in_first_2_allele_designators()
 
-    def _is_synonym(self) -> bool:
-        return self._gene_name in HOMOSAPIENS_MH_SYNONYMS
-
     def _resolve_common_errors(self) -> None:
         if not self._gene_name.startswith("HLA-"):
             self._gene_name = "HLA-" + self._gene_name
@@ -100,7 +141,7 @@ class StandardizedHlaSymbol(StandardizedGeneSymbol):
 
     def _handle_forgotten_asterisk(self) -> None:
         if not self._allele_designation:
-            m = re.match(r"^(HLA-[A-Z]+)([\d:]+G?P?)$", self._gene_name)
+            m = GENE_NAME_WITH_FORGOTTEN_ASTERISK_MATCHING_REGEX.match(self._gene_name)
             if m:
                 self._gene_name = m.group(1)
                 self._allele_designation = m.group(2).split(":")
@@ -172,9 +213,7 @@ class StandardizedHlaSymbol(StandardizedGeneSymbol):
         if not self._allele_designation:
             return False
 
-        return self._allele_designation[-1].endswith("G") or self._allele_designation[
-            -1
-        ].endswith("P")
+        return self._allele_designation[-1].endswith(("G", "P"))
 
     def compile(self, precision: str = "allele") -> str:
         if self._allele_designation:
@@ -5,5 +5,7 @@ from tidytcells._resources import VALID_HOMOSAPIENS_TR, HOMOSAPIENS_TR_SYNONYMS
 
 
 class StandardizedHomoSapiensTrSymbol(StandardizedTrSymbol):
+    __slots__ = ()
+
     _synonym_dictionary = HOMOSAPIENS_TR_SYNONYMS
     _valid_tr_dictionary = VALID_HOMOSAPIENS_TR
@@ -6,12 +6,17 @@ from tidytcells._resources import VALID_MUSMUSCULUS_MH, MUSMUSCULUS_MH_SYNONYMS
 from tidytcells._standardized_gene_symbol import StandardizedGeneSymbol
 
 
+MH_SYMBOL_MATCHING_REGEX = re.compile(r"^([A-Z0-9\-\.\(\)\/]+)(\*(\d+))?")
+
+
 class MhSymbolParser:
+    __slots__ = ("gene_name", "allele_designation")
+
     gene_name: str
     allele_designation: str
 
     def __init__(self, mh_symbol: str) -> None:
-        parse_attempt = re.match(r"^([A-Z0-9\-\.\(\)\/]+)(\*(\d+))?", mh_symbol)
+        parse_attempt = MH_SYMBOL_MATCHING_REGEX.match(mh_symbol)
 
         if parse_attempt:
             self.gene_name = parse_attempt.group(1)
@@ -26,6 +31,8 @@ class MhSymbolParser:
 
 
 class StandardizedMusMusculusMhSymbol(StandardizedGeneSymbol):
+    __slots__ = ("_gene_name", "_allele_designation")
+
     def __init__(self, gene_symbol: str) -> None:
         self._parse_mh_symbol(gene_symbol)
         self._resolve_errors()
@@ -40,14 +47,14 @@ class StandardizedMusMusculusMhSymbol(StandardizedGeneSymbol):
         if self.get_reason_why_invalid() is None:
             return
 
-        if self._is_synonym():
-            self._gene_name = MUSMUSCULUS_MH_SYNONYMS[self._gene_name.replace("-", "")]
+        current_gene_name = MUSMUSCULUS_MH_SYNONYMS.get(
+            self._gene_name.replace("-", "")
+        )
+        if current_gene_name is not None:
+            self._gene_name = current_gene_name
             if self.get_reason_why_invalid() is None:
                 return
 
-    def _is_synonym(self) -> bool:
-        return self._gene_name.replace("-", "") in MUSMUSCULUS_MH_SYNONYMS
-
     def get_reason_why_invalid(self, enforce_functional: bool = False) -> Optional[str]:
         if not self._gene_name in VALID_MUSMUSCULUS_MH:
             return "unrecognised gene name"
@@ -5,5 +5,7 @@ from tidytcells._resources import VALID_MUSMUSCULUS_TR
 
 
 class StandardizedMusMusculusTrSymbol(StandardizedTrSymbol):
+    __slots__ = ()
+
     _synonym_dictionary = dict()
     _valid_tr_dictionary = VALID_MUSMUSCULUS_TR
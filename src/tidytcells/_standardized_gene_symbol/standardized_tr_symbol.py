@@ -1,17 +1,37 @@
 from abc import abstractmethod
 import re
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, Optional
 
 from tidytcells import _utils
 from tidytcells._standardized_gene_symbol import StandardizedGeneSymbol
 
+# Single-character fixes are done with one translate pass, and the remaining
+# fixes are applied in a single regex pass. The lookbehinds are written against
+# the uncorrected string, hence the extra (?<!TCR) guard which stops "TCRDV"
+# from gaining a slash once it has become "TRDV".
+COMMON_ERROR_TRANSLATION_TABLE = str.maketrans({"S": "-", ".": "-"})
+COMMON_ERROR_MATCHING_REGEX = re.compile(
+    r"TCR|(?<!TR)(?<!TCR)(?<!\/)DV|(?<!\/)OR|(?<!\d)0"
+)
+COMMON_ERROR_FIXES = {
+    "TCR": "TR",
+    "DV": "/DV",
+    "OR": "/OR",
+    "0": "",
+}
+COMPOUND_TRAV_MATCHING_REGEX = re.compile(r"^TRAV\d+(-\d)?\/(DV.+)$")
+TR_SYMBOL_MATCHING_REGEX = re.compile(r"^([A-Z0-9\-\.\(\)\/]+)(\*(\d+))?")
+TRAV_MISSING_AV_MATCHING_REGEX = re.compile(r"^TR([\d-]+)\/(DV[\d-]+)$")
+
 
 class TrSymbolParser:
+    __slots__ = ("gene_name", "allele_designation")
+
     gene_name: str
     allele_designation: int
 
     def __init__(self, tr_symbol: str) -> None:
-        parse_attempt = re.match(r"^([A-Z0-9\-\.\(\)\/]+)(\*(\d+))?", tr_symbol)
+        parse_attempt = TR_SYMBOL_MATCHING_REGEX.match(tr_symbol)
 
         if parse_attempt:
             self.gene_name = parse_attempt.group(1)
@@ -26,6 +46,8 @@ class TrSymbolParser:
 
 
 class StandardizedTrSymbol(StandardizedGeneSymbol):
+    __slots__ = ("_gene_name", "_allele_designation")
+
     @property
     @abstractmethod
     def _synonym_dictionary(self) -> Dict[str, str]:
@@ -36,11 +58,46 @@ class StandardizedTrSymbol(StandardizedGeneSymbol):
     def _valid_tr_dictionary(self) -> Dict[str, Dict[int, str]]:
         pass
 
+    _valid_tr_symbols: FrozenSet[str]
+    _compound_trav_genes_by_dv_segment: Dict[str, str]
+    _compound_trav_genes_by_trav_segment: Dict[str, str]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        valid_alleles = [
+            f"{gene}*{allele_designation}"
+            for gene, allele_dictionary in cls._valid_tr_dictionary.items()
+            for allele_designation in allele_dictionary
+        ]
+        cls._valid_tr_symbols = frozenset([*cls._valid_tr_dictionary, *valid_alleles])
+
+        cls._compound_trav_genes_by_dv_segment = dict()
+        cls._compound_trav_genes_by_trav_segment = dict()
+        for valid_gene in cls._valid_tr_dictionary:
+            parse_attempt = COMPOUND_TRAV_MATCHING_REGEX.match(valid_gene)
+            if parse_attempt:
+                cls._compound_trav_genes_by_dv_segment.setdefault(
+                    parse_attempt.group(2), valid_gene
+                )
+
+            if "/DV" in valid_gene:
+                trav_segment, _, _ = valid_gene.partition("/DV")
+                cls._compound_trav_genes_by_trav_segment.setdefault(
+                    trav_segment, valid_gene
+                )
+
     def __init__(self, gene_symbol: str) -> None:
         self._parse_tr_symbol(gene_symbol)
         self._resolve_gene_name()
 
     def _parse_tr_symbol(self, tr_symbol: str) -> None:
+        # Symbols that are already IMGT-compliant need no cleaning or parsing
+        if tr_symbol in self._valid_tr_symbols:
+            self._gene_name, _, allele_designation = tr_symbol.partition("*")
+            self._allele_designation = allele_designation or None
+            return
+
         cleaned_tr_symbol = _utils.clean_and_uppercase(tr_symbol)
         parsed_tr_symbol = TrSymbolParser(cleaned_tr_symbol)
         self._gene_name = parsed_tr_symbol.gene_name
@@ -50,8 +107,9 @@ class StandardizedTrSymbol(StandardizedGeneSymbol):
         if self._has_valid_gene_name():
             return
 
-        if self._is_synonym():
-            self._gene_name = self._synonym_dictionary[self._gene_name]
+        current_gene_name = self._synonym_dictionary.get(self._gene_name)
+        if current_gene_name is not None:
+            self._gene_name = current_gene_name
             return
 
         self._fix_common_errors_in_tr_gene_name()
@@ -84,16 +142,11 @@ class StandardizedTrSymbol(StandardizedGeneSymbol):
     def _has_valid_gene_name(self) -> bool:
         return self._gene_name in self._valid_tr_dictionary
 
-    def _is_synonym(self) -> bool:
-        return self._gene_name in self._synonym_dictionary
-
     def _fix_common_errors_in_tr_gene_name(self) -> None:
-        self._gene_name = self._gene_name.replace("TCR", "TR")
-        self._gene_name = self._gene_name.replace("S", "-")
-        self._gene_name = self._gene_name.replace(".", "-")
-        self._gene_name = re.sub(r"(?<!TR)(?<!\/)DV", "/DV", self._gene_name)
-        self._gene_name = re.sub(r"(?<!\/)OR", "/OR", self._gene_name)
-        self._gene_name = re.sub(r"(?<!\d)0", "", self._gene_name)
+        gene_name = self._gene_name.translate(COMMON_ERROR_TRANSLATION_TABLE)
+        self._gene_name = COMMON_ERROR_MATCHING_REGEX.sub(
+            lambda match: COMMON_ERROR_FIXES[match.group()], gene_name
+        )
 
     def _try_resolving_trdv_designation_from_trav_info(self) -> None:
         if "/" in self._gene_name:
@@ -101,18 +154,18 @@ class StandardizedTrSymbol(StandardizedGeneSymbol):
             dv_segment = "DV" + split_gene_name.pop()
             self._gene_name = "/".join([*split_gene_name, dv_segment])
         else:
-            for valid_gene_name in self._valid_tr_dictionary:
-                if valid_gene_name.startswith(self._gene_name + "/DV"):
-                    self._gene_name = valid_gene_name
+            self._gene_name = self._compound_trav_genes_by_trav_segment.get(
+                self._gene_name, self._gene_name
+            )
 
     def _try_resolving_trav_designation_from_trdv_info(self) -> None:
         if self._gene_name.startswith("TRDV"):
-            for valid_gene in self._valid_tr_dictionary:
-                dv_segment = self._gene_name[2:]
-                if re.match(rf"^TRAV\d+(-\d)?\/{dv_segment}$", valid_gene):
-                    self._gene_name = valid_gene
+            dv_segment = self._gene_name[2:]
+            self._gene_name = self._compound_trav_genes_by_dv_segment.get(
+                dv_segment, self._gene_name
+            )
         else:
-            parse_attempt = re.match(r"^TR([\d-]+)\/(DV[\d-]+)$", self._gene_name)
+            parse_attempt = TRAV_MISSING_AV_MATCHING_REGEX.match(self._gene_name)
             if parse_attempt:
                 self._gene_name = (
                     f"TRAV{parse_attempt.group(1)}/{parse_attempt.group(2)}"
@@ -1,3 +1,3 @@
 from .parameter import Parameter
 from .string_cleaning import clean_and_lowercase, clean_and_uppercase
-from .warnings import warn_failure, warn_unsupported_species
+from .warnings import warn_failure, warn_unsupported_species, warnings_are_ignored
@@ -2,6 +2,8 @@ import warnings
 
 
 class Parameter:
+    __slots__ = ("value", "name")
+
     def __init__(self, value: any, name: str) -> None:
         self.value = value
         self.name = name
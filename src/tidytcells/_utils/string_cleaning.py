@@ -10,6 +10,10 @@ def clean_and_uppercase(string: str) -> str:
 
 def remove_whitespace_and_pollutants(string: str) -> str:
     string = "".join(string.split())
-    string = string.replace("&nbsp;", "")
-    string = string.replace("&ndash;", "-")
+
+    # HTML entity pollutants are rare, so skip the replace scans unless one could be present
+    if "&" in string:
+        string = string.replace("&nbsp;", "")
+        string = string.replace("&ndash;", "-")
+
     return string
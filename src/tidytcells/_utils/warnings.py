@@ -1,6 +1,24 @@
+import warnings
 from warnings import warn
 
 
+def warnings_are_ignored(category: type = UserWarning) -> bool:
+    """
+    Return True only if the active warning filters are guaranteed to discard warnings of the given category.
+    Filters that depend on the message or the calling module are treated as possibly letting the warning through.
+    """
+    for action, message, filter_category, module, lineno in warnings.filters:
+        if not issubclass(category, filter_category):
+            continue
+
+        if message is not None or module is not None or lineno != 0:
+            return False
+
+        return action == "ignore"
+
+    return warnings.defaultaction == "ignore"
+
+
 def warn_failure(
     reason_for_failure: str, original_input: str, attempted_fix: str, species: str
 ):
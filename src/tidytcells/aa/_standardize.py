@@ -74,15 +74,14 @@ def standardize(seq: str, on_fail: str = "reject", suppress_warnings: bool = Fal
 
     seq = seq.upper()
 
-    for char in seq:
-        if not char in AMINO_ACIDS:
-            if not suppress_warnings:
-                warnings.warn(
-                    f"Failed to standardize {original_input}: not a valid amino acid sequence."
-                )
-            if on_fail == "reject":
-                return None
-            return original_input
+    if not AMINO_ACIDS.issuperset(seq):
+        if not suppress_warnings:
+            warnings.warn(
+                f"Failed to standardize {original_input}: not a valid amino acid sequence."
+            )
+        if on_fail == "reject":
+            return None
+        return original_input
 
     return seq
 
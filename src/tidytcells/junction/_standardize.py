@@ -1,12 +1,8 @@
-import re
 import warnings
 
 from tidytcells import aa
 
 
-JUNCTION_MATCHING_REGEX = re.compile(f"^C[A-Z]*[FW]$")
-
-
 def standardize(
     seq: str,
     strict: bool = False,
@@ -109,7 +105,8 @@ def standardize(
             return None
         return original_input
 
-    if not JUNCTION_MATCHING_REGEX.match(seq):
+    # seq is known to be a valid amino acid sequence, so only its ends need checking
+    if not (seq.startswith("C") and seq.endswith(("F", "W"))):
         if strict:
             if not suppress_warnings:
                 warnings.warn(
@@ -118,7 +115,7 @@ def standardize(
             if on_fail == "reject":
                 return None
             return original_input
-        seq = "C" + seq + "F"
+        seq = f"C{seq}F"
 
     return seq
 
@@ -1,5 +1,5 @@
 import re
-from typing import Optional
+from typing import Dict, Optional
 import warnings
 
 from tidytcells._resources import VALID_HOMOSAPIENS_MH
@@ -10,6 +10,21 @@ ALPHA_MATCHING_REGEX = re.compile(r"HLA-([ABCEFG]|D[PQR]A)")
 BETA_MATCHING_REGEX = re.compile(r"HLA-D[PQR]B|B2M")
 
 
+def _get_chain_of_recognised_gene(gene: str) -> Optional[str]:
+    if ALPHA_MATCHING_REGEX.match(gene):
+        return "alpha"
+
+    if BETA_MATCHING_REGEX.match(gene):
+        return "beta"
+
+    return None
+
+
+RECOGNISED_GENES_AND_THEIR_CHAINS: Dict[str, Optional[str]] = {
+    gene: _get_chain_of_recognised_gene(gene) for gene in (*VALID_HOMOSAPIENS_MH, "B2M")
+}
+
+
 def get_chain(
     gene: Optional[str] = None,
     suppress_warnings: bool = False,
@@ -47,18 +62,16 @@ def get_chain(
     """
     Parameter(gene, "gene").throw_error_if_not_of_type(str)
 
-    gene = gene.split("*")[0]
+    gene, _, _ = gene.partition("*")
 
-    if not gene in (*VALID_HOMOSAPIENS_MH, "B2M"):
+    if not gene in RECOGNISED_GENES_AND_THEIR_CHAINS:
         if not suppress_warnings:
             warnings.warn(f"Unrecognised gene {gene}. Is this standardized?")
         return None
 
-    if ALPHA_MATCHING_REGEX.match(gene):
-        return "alpha"
-
-    if BETA_MATCHING_REGEX.match(gene):
-        return "beta"
+    chain = RECOGNISED_GENES_AND_THEIR_CHAINS[gene]
+    if chain is not None:
+        return chain
 
     if not suppress_warnings:
         warnings.warn(f"Chain for {gene} unknown.")
@@ -1,5 +1,5 @@
 import re
-from typing import Optional
+from typing import Dict, Optional
 import warnings
 
 from tidytcells._resources import VALID_HOMOSAPIENS_MH
@@ -10,6 +10,21 @@ CLASS_1_MATCHING_REGEX = re.compile(r"HLA-[ABCEFG]|B2M")
 CLASS_2_MATCHING_REGEX = re.compile(r"HLA-D[PQR][AB]")
 
 
+def _get_class_of_recognised_gene(gene: str) -> Optional[int]:
+    if CLASS_1_MATCHING_REGEX.match(gene):
+        return 1
+
+    if CLASS_2_MATCHING_REGEX.match(gene):
+        return 2
+
+    return None
+
+
+RECOGNISED_GENES_AND_THEIR_CLASSES: Dict[str, Optional[int]] = {
+    gene: _get_class_of_recognised_gene(gene) for gene in (*VALID_HOMOSAPIENS_MH, "B2M")
+}
+
+
 def get_class(
     gene: Optional[str] = None,
     suppress_warnings: bool = False,
@@ -47,18 +62,16 @@ def get_class(
     """
     Parameter(gene, "gene").throw_error_if_not_of_type(str)
 
-    gene = gene.split("*")[0]
+    gene, _, _ = gene.partition("*")
 
-    if not gene in (*VALID_HOMOSAPIENS_MH, "B2M"):
+    if not gene in RECOGNISED_GENES_AND_THEIR_CLASSES:
         if not suppress_warnings:
             warnings.warn(f"Unrecognised gene {gene}. Is this standardized?")
         return None
 
-    if CLASS_1_MATCHING_REGEX.match(gene):
-        return 1
-
-    if CLASS_2_MATCHING_REGEX.match(gene):
-        return 2
+    mh_class = RECOGNISED_GENES_AND_THEIR_CLASSES[gene]
+    if mh_class is not None:
+        return mh_class
 
     if not suppress_warnings:
         warnings.warn(f"Class for {gene} unknown.")
@@ -1,3 +1,4 @@
+import functools
 from typing import Dict, Optional, Type
 
 from tidytcells import _utils
@@ -145,20 +146,22 @@ def standardize(
     Parameter(on_fail, "on_fail").throw_error_if_not_one_of("reject", "keep")
     Parameter(suppress_warnings, "suppress_warnings").throw_error_if_not_of_type(bool)
 
-    species = _utils.clean_and_lowercase(species)
+    if species not in SUPPORTED_SPECIES_AND_THEIR_STANDARDIZERS:
+        species = _utils.clean_and_lowercase(species)
 
-    species_is_supported = species in SUPPORTED_SPECIES_AND_THEIR_STANDARDIZERS
-    if not species_is_supported:
+    StandardizedMhSymbolClass = SUPPORTED_SPECIES_AND_THEIR_STANDARDIZERS.get(species)
+    if StandardizedMhSymbolClass is None:
         if not suppress_warnings:
             _utils.warn_unsupported_species(species, "MH")
         return gene
 
-    StandardizedMhSymbolClass = SUPPORTED_SPECIES_AND_THEIR_STANDARDIZERS[species]
-    standardized_mh_symbol = StandardizedMhSymbolClass(gene)
+    standardized_mh_symbol = _get_standardized_mh_symbol(
+        StandardizedMhSymbolClass, gene
+    )
 
     invalid_reason = standardized_mh_symbol.get_reason_why_invalid()
     if invalid_reason is not None:
-        if not suppress_warnings:
+        if not (suppress_warnings or _utils.warnings_are_ignored()):
             _utils.warn_failure(
                 reason_for_failure=invalid_reason,
                 original_input=gene,
@@ -172,6 +175,16 @@ def standardize(
     return standardized_mh_symbol.compile(precision)
 
 
+@functools.lru_cache(maxsize=65536)
+def _get_standardized_mh_symbol(
+    StandardizedMhSymbolClass: Type[StandardizedGeneSymbol], gene: str
+) -> StandardizedGeneSymbol:
+    """
+    Build the standardized MH symbol for a given input, reusing the instance from an earlier call with the same input where possible.
+    """
+    return StandardizedMhSymbolClass(gene)
+
+
 def standardise(*args, **kwargs):
     """
     Alias for :py:func:`tidytcells.mh.standardize`.
@@ -1,16 +1,12 @@
 from typing import Dict
 
-from tidytcells._resources import (
-    HOMOSAPIENS_TR_AA_SEQUENCES,
-    MUSMUSCULUS_TR_AA_SEQUENCES,
-)
-from tidytcells import _utils
+from tidytcells import _resources, _utils
 from tidytcells._utils import Parameter
 
 
-SUPPORTED_SPECIES_AND_THEIR_AA_SEQUENCES = {
-    "homosapiens": HOMOSAPIENS_TR_AA_SEQUENCES,
-    "musmusculus": MUSMUSCULUS_TR_AA_SEQUENCES,
+SUPPORTED_SPECIES_AND_THEIR_AA_SEQUENCE_RESOURCES = {
+    "homosapiens": "HOMOSAPIENS_TR_AA_SEQUENCES",
+    "musmusculus": "MUSMUSCULUS_TR_AA_SEQUENCES",
 }
 
 
@@ -55,15 +51,17 @@ def get_aa_sequence(gene: str, species: str = "homosapiens") -> Dict[str, str]:
     Parameter(gene, "gene").throw_error_if_not_of_type(str)
     Parameter(species, "species").throw_error_if_not_of_type(str)
 
-    species = _utils.clean_and_lowercase(species)
+    if species not in SUPPORTED_SPECIES_AND_THEIR_AA_SEQUENCE_RESOURCES:
+        species = _utils.clean_and_lowercase(species)
 
-    species_is_supported = species in SUPPORTED_SPECIES_AND_THEIR_AA_SEQUENCES
-    if not species_is_supported:
+    resource_name = SUPPORTED_SPECIES_AND_THEIR_AA_SEQUENCE_RESOURCES.get(species)
+    if resource_name is None:
         raise ValueError(f"Unsupported species: {species}. No data available.")
 
-    aa_sequence_dict = SUPPORTED_SPECIES_AND_THEIR_AA_SEQUENCES[species]
+    aa_sequence_dict = getattr(_resources, resource_name)
 
-    if gene in aa_sequence_dict:
-        return aa_sequence_dict[gene]
+    aa_sequence = aa_sequence_dict.get(gene)
+    if aa_sequence is None:
+        raise ValueError(f"No data found for TR gene {gene} for species {species}.")
 
-    raise ValueError(f"No data found for TR gene {gene} for species {species}.")
+    return aa_sequence
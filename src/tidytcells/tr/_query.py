@@ -87,17 +87,17 @@ def query(
         str, optional=True
     )
 
-    species = _utils.clean_and_lowercase(species)
+    if species not in QUERY_ENGINES:
+        species = _utils.clean_and_lowercase(species)
 
-    species_is_supported = species in QUERY_ENGINES
-    if not species_is_supported:
+    query_engine = QUERY_ENGINES.get(species)
+    if query_engine is None:
         raise ValueError(f"Unsupported species: {species}. No data available.")
 
-    query_engine = QUERY_ENGINES[species]
     result = query_engine.query(precision, functionality)
 
     if contains_pattern is None:
         return result
 
-    results_containing_substring = [i for i in result if re.search(contains_pattern, i)]
-    return frozenset(results_containing_substring)
+    pattern_search = re.compile(contains_pattern).search
+    return frozenset(filter(pattern_search, result))
@@ -1,3 +1,4 @@
+import functools
 from typing import Dict, Optional, Type
 
 from tidytcells import _utils
@@ -162,20 +163,22 @@ def standardize(
     Parameter(on_fail, "on_fail").throw_error_if_not_one_of("reject", "keep")
     Parameter(suppress_warnings, "suppress_warnings").throw_error_if_not_of_type(bool)
 
-    species = _utils.clean_and_lowercase(species)
+    if species not in SUPPORTED_SPECIES_AND_THEIR_STANDARDIZERS:
+        species = _utils.clean_and_lowercase(species)
 
-    species_is_supported = species in SUPPORTED_SPECIES_AND_THEIR_STANDARDIZERS
-    if not species_is_supported:
+    StandardizedTrSymbolClass = SUPPORTED_SPECIES_AND_THEIR_STANDARDIZERS.get(species)
+    if StandardizedTrSymbolClass is None:
         if not suppress_warnings:
             _utils.warn_unsupported_species(species, "TR")
         return gene
 
-    StandardizedTrSymbolClass = SUPPORTED_SPECIES_AND_THEIR_STANDARDIZERS[species]
-    standardized_tr_symbol = StandardizedTrSymbolClass(gene)
+    standardized_tr_symbol = _get_standardized_tr_symbol(
+        StandardizedTrSymbolClass, gene
+    )
 
     invalid_reason = standardized_tr_symbol.get_reason_why_invalid(enforce_functional)
     if invalid_reason is not None:
-        if not suppress_warnings:
+        if not (suppress_warnings or _utils.warnings_are_ignored()):
             _utils.warn_failure(
                 reason_for_failure=invalid_reason,
                 original_input=gene,
@@ -189,6 +192,16 @@ def standardize(
     return standardized_tr_symbol.compile(precision)
 
 
+@functools.lru_cache(maxsize=65536)
+def _get_standardized_tr_symbol(
+    StandardizedTrSymbolClass: Type[StandardizedGeneSymbol], gene: str
+) -> StandardizedGeneSymbol:
+    """
+    Standardized symbols are not mutated after construction, so repeated inputs (common in repertoire data) can share one instance.
+    """
+    return StandardizedTrSymbolClass(gene)
+
+
 def standardise(*args, **kwargs):
     """
     Alias for :py:func:`tidytcells.tr.standardize`.
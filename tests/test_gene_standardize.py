@@ -0,0 +1,54 @@
+import pytest
+from tidytcells import _utils, mh, tr
+import warnings
+
+
+@pytest.mark.parametrize(
+    ("module", "symbol", "expected"),
+    (
+        (tr, "TCRBV21S1*01", "TRBV11-1*01"),
+        (mh, "A1", "HLA-A*01"),
+    ),
+)
+def test_repeated_calls(module, symbol, expected):
+    for _ in range(2):
+        with pytest.warns(UserWarning, match="Failed to standardize"):
+            result = module.standardize("foobarbaz")
+
+        assert result == None
+
+    for _ in range(2):
+        result = module.standardize(symbol)
+
+        assert result == expected
+
+
+@pytest.mark.parametrize("module", (tr, mh))
+def test_warning_filters(module, monkeypatch):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        warnings.filterwarnings("ignore", message="Unsupported")
+        result = module.standardize("foobarbaz")
+
+    assert result == None
+    assert len(caught) == 1
+    assert "Failed to standardize" in str(caught[0].message)
+
+    failure_warnings = []
+    monkeypatch.setattr(
+        _utils, "warn_failure", lambda **kwargs: failure_warnings.append(kwargs)
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("always")
+        result = module.standardize("foobarbaz")
+
+    assert result == None
+    assert len(failure_warnings) == 1
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = module.standardize("foobarbaz")
+
+    assert result == None
+    assert len(failure_warnings) == 1
@@ -23,6 +23,14 @@ class TestStandardize:
 
         assert result == "HLA-B*07"
 
+    @pytest.mark.parametrize(
+        "species", ("HomoSapiens", " homo sapiens ", "homosapiens")
+    )
+    def test_species_cleaning(self, species):
+        result = mh.standardize("HLA-B*07", species=species)
+
+        assert result == "HLA-B*07"
+
     @pytest.mark.parametrize(
         ("gene", "expected", "precision"),
         (
@@ -125,7 +133,7 @@ class TestStandardizeHomoSapiens:
 
 
 class TestStandardizeMusMusculus:
-    @pytest.mark.parametrize("gene", VALID_MUSMUSCULUS_MH)
+    @pytest.mark.parametrize("gene", sorted(VALID_MUSMUSCULUS_MH))
     def test_already_correctly_formatted(self, gene):
         result = mh.standardize(gene=gene, species="musmusculus")
 
@@ -163,7 +171,7 @@ class TestQuery:
     ):
         result = mh.query(species=species, precision=precision)
 
-        assert type(result) == frozenset
+        assert type(result) is frozenset
         assert len(result) == expected_len
         assert expected_in in result
         assert not expected_not_in in result
@@ -22,6 +22,14 @@ class TestStandardize:
 
         assert result == "TRBV20/OR9-2*01"
 
+    @pytest.mark.parametrize(
+        "species", ("HomoSapiens", " homo sapiens ", "homosapiens")
+    )
+    def test_species_cleaning(self, species):
+        result = tr.standardize("TRBV20/OR9-2*01", species=species)
+
+        assert result == "TRBV20/OR9-2*01"
+
     @pytest.mark.parametrize(
         ("gene", "expected"),
         (("TRAV3*01&nbsp;", "TRAV3*01"), (" TRAV3 * 01 ", "TRAV3*01")),
@@ -86,7 +94,7 @@ class TestStandardizeHomoSapiens:
 
         assert result == gene
 
-    @pytest.mark.parametrize("gene", ("foobar", "TRAV3D-3*01"))
+    @pytest.mark.parametrize("gene", ("foobar", "TRAV3D-3*01", "TRDV(4"))
     def test_invalid_tr(self, gene):
         with pytest.warns(UserWarning, match="Failed to standardize"):
             result = tr.standardize(gene=gene, species="homosapiens")
@@ -145,6 +153,18 @@ class TestStandardizeMusMusculus:
 
         assert result == None
 
+    @pytest.mark.parametrize(
+        ("gene", "expected"),
+        (
+            ("TRDV6-1", "TRAV15-1/DV6-1"),
+            ("TCRAV15-1DV6-1", "TRAV15-1/DV6-1"),
+        ),
+    )
+    def test_various_typos(self, gene, expected):
+        result = tr.standardize(gene=gene, species="musmusculus")
+
+        assert result == expected
+
 
 class TestQuery:
     @pytest.mark.parametrize(
@@ -161,7 +181,7 @@ class TestQuery:
     ):
         result = tr.query(species=species, precision=precision)
 
-        assert type(result) == frozenset
+        assert type(result) is frozenset
         assert len(result) == expected_len
         assert expected_in in result
         assert not expected_not_in in result
@@ -275,3 +295,11 @@ class TestGetAaSequence:
         result = tr.get_aa_sequence(gene=gene, species=species)
 
         assert result == expected
+
+    @pytest.mark.parametrize(
+        ("gene", "species"),
+        (("TRAV1*01", "foobar"), ("foobar", "homosapiens"), ("TRAV1", "homosapiens")),
+    )
+    def test_no_data(self, gene, species):
+        with pytest.raises(ValueError):
+            tr.get_aa_sequence(gene=gene, species=species)